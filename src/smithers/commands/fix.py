@@ -297,10 +297,10 @@ def _run_fix_planning(
 
     logger.info("Running Claude Code to create fix plan")
     print_info("Running Claude Code to fetch PR comments and create fix plan...")
-    result = claude_service.run_prompt(planning_prompt)
-
-    if config.verbose:
-        console.print(result.output)
+    result = claude_service.run_prompt(
+        planning_prompt,
+        on_line=sys.stdout.write if config.verbose else None,
+    )
 
     if not result.success:
         logger.warning(f"Claude Code failed during TODO creation: exit_code={result.exit_code}")
@@ -405,7 +405,7 @@ def _setup_pr_worktrees(
             todo_file_path=todo_file,
             todo_content=todo_content,
         )
-        prompt_file.write_text(prompt)
+        prompt_file.write_bytes(prompt.encode("utf-8"))
 
         # Find or create vibekanban task for this PR fix session
         pr_vk_task_id = _get_or_create_vibekanban_task(
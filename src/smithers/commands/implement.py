@@ -112,10 +112,10 @@ def run_revision_session(
     )
 
     print_info("Running Claude Code for plan revision...")
-    result = claude_service.run_prompt(revision_prompt)
-
-    if config.verbose:
-        console.print(result.output)
+    result = claude_service.run_prompt(
+        revision_prompt,
+        on_line=sys.stdout.write if config.verbose else None,
+    )
 
     if not result.success:
         logger.error(f"Claude Code failed during revision: exit_code={result.exit_code}")
@@ -157,10 +157,10 @@ def run_planning_session(
     )
 
     print_info("Running Claude Code for planning...")
-    result = claude_service.run_prompt(planning_prompt)
-
-    if config.verbose:
-        console.print(result.output)
+    result = claude_service.run_prompt(
+        planning_prompt,
+        on_line=sys.stdout.write if config.verbose else None,
+    )
 
     if not result.success:
         logger.error(f"Claude Code failed during planning: exit_code={result.exit_code}")
@@ -433,7 +433,8 @@ def implement(
     # Report results
     print_header("Implementation Complete!")
     console.print(f"TODO file: [cyan]{todo_file_path}[/cyan]")
-    console.print(f"PRs created: [green]{', '.join(f'#{pr}' for pr in collected_prs)}[/green]")
+    pr_list = f"#{', #'.join(map(str, collected_prs))}" if collected_prs else ""
+    console.print(f"PRs created: [green]{pr_list}[/green]")
 
     # Transition to standardize and fix modes if we have PRs
     if collected_prs:
@@ -623,7 +624,7 @@ def _run_implementation_phase(
     # Process each stage sequentially
     for stage in todo.stages:
         # Skip completed stages when in resume mode
-        if resume and stage.status == StageStatus.COMPLETED:
+        if resume and stage.status is StageStatus.COMPLETED:
             logger.info(f"Skipping completed Stage {stage.number}")
             console.print(f"[dim]Skipping completed Stage {stage.number}[/dim]")
             continue
@@ -664,7 +665,7 @@ def _run_implementation_phase(
             todo_content=todo_content,
             session_name=session_name,
         )
-        prompt_file.write_text(prompt)
+        prompt_file.write_bytes(prompt.encode("utf-8"))
 
         # Find or create vibekanban task for this stage session (reuses existing tasks)
         stage_vk_task_id = vibekanban_service.find_or_create_task(
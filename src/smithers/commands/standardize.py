@@ -1,6 +1,7 @@
 """Standardize command - standardize titles and descriptions for a series of PRs."""
 
 import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from typing import Annotated, Any
@@ -188,11 +189,12 @@ def standardize(
     analysis_prompt = render_standardize_analysis_prompt(pr_diffs)
     logger.debug(f"Analysis prompt length: {len(analysis_prompt)} chars")
 
-    analysis_result = claude_service.run_prompt(analysis_prompt)
-
     if verbose:
         print_header("Analysis Output")
-        console.print(analysis_result.output)
+    analysis_result = claude_service.run_prompt(
+        analysis_prompt,
+        on_line=sys.stdout.write if verbose else None,
+    )
 
     if not analysis_result.success:
         logger.error(f"Claude analysis failed: exit_code={analysis_result.exit_code}")
@@ -241,11 +243,12 @@ def standardize(
     )
     logger.debug(f"Update prompt length: {len(update_prompt)} chars")
 
-    update_result = claude_service.run_prompt(update_prompt)
-
     if verbose:
         print_header("Update Output")
-        console.print(update_result.output)
+    update_result = claude_service.run_prompt(
+        update_prompt,
+        on_line=sys.stdout.write if verbose else None,
+    )
 
     if not update_result.success:
         logger.error(f"Claude update failed: exit_code={update_result.exit_code}")
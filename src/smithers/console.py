@@ -1,5 +1,6 @@
 """Rich console singleton and helpers for terminal output."""
 
+import os
 from typing import TYPE_CHECKING
 
 from rich.console import Console
@@ -14,8 +15,18 @@ if TYPE_CHECKING:
 console = Console()
 
 
+# Only pay for Rich panels and markup rendering on an interactive, colored terminal.
+# Redirected output (CI, log files) gets plain text instead.
+def _rich_on() -> bool:
+    """Return whether output should use Rich panels and markup."""
+    return console.is_terminal and not os.environ.get("NO_COLOR")
+
+
 def print_header(title: str) -> None:
     """Print a styled header."""
+    if not _rich_on():
+        console.out(f"\n=== {title} ===\n", highlight=False)
+        return
     console.print()
     console.print(Panel(title, style="bold blue"))
     console.print()
@@ -23,21 +34,33 @@ def print_header(title: str) -> None:
 
 def print_success(message: str) -> None:
     """Print a success message."""
+    if not _rich_on():
+        console.out(message, highlight=False)
+        return
     console.print(f"[green]{message}[/green]")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
+    if not _rich_on():
+        console.out(f"Error: {message}", highlight=False)
+        return
     console.print(f"[red]Error: {message}[/red]")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
+    if not _rich_on():
+        console.out(f"Warning: {message}", highlight=False)
+        return
     console.print(f"[yellow]Warning: {message}[/yellow]")
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
+    if not _rich_on():
+        console.out(message, highlight=False)
+        return
     console.print(f"[blue]{message}[/blue]")
 
 
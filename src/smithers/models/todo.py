@@ -98,7 +98,8 @@ class TodoFile:
 
     def get_completed_stages(self) -> list[Stage]:
         """Get all stages with completed status."""
-        return [s for s in self.stages if s.status == StageStatus.COMPLETED]
+        completed = StageStatus.COMPLETED
+        return [s for s in self.stages if s.status is completed]
 
 
 def _parse_stage_line(line: str, data: dict[str, object]) -> dict[str, object]:
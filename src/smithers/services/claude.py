@@ -1,11 +1,18 @@
 """Claude CLI service for AI-powered code generation."""
 
+import contextlib
+import functools
 import json
+import os
 import re
+import shlex
 import subprocess
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from shutil import which
+from typing import IO, Any
 
 from smithers.console import print_info
 from smithers.exceptions import ClaudeError, DependencyMissingError
@@ -13,6 +20,46 @@ from smithers.logging_config import get_logger, log_subprocess_result
 
 logger = get_logger("smithers.services.claude")
 
+# Shell commands for running Claude in tmux; all substituted values are shlex-quoted
+_TMUX_CLAUDE_TMPL = "claude --model {model} --print --output-format stream-json --verbose{skip}"
+_TMUX_COMMAND_TMPL = "cat {prompt} | {claude} > {output} 2>&1 ; echo $? > {exit}"
+_TMUX_TEE_COMMAND_TMPL = (
+    "cat {prompt} | {claude} | tee {stream_log} > {output} 2>&1 ; echo $? > {exit}"
+)
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=128)
+def _key_re(key: str) -> re.Pattern[str]:
+    """Return the compiled 'KEY: value' pattern for a key."""
+    return re.compile(rf"{re.escape(key)}:\s*(\S+)")
+
+
+@functools.lru_cache(maxsize=1)
+def _claude_missing(path: str) -> tuple[str, ...]:
+    """Probe for the claude CLI on PATH, memoized per PATH value."""
+    claude_path = which("claude", path=path or None)
+    if claude_path is None:
+        logger.warning("claude CLI not found on PATH")
+        return ("claude",)
+    logger.debug(f"claude CLI found at: {claude_path}")
+    return ()
+
+
+def _feed_stdin(stdin: IO[str], prompt: str) -> None:
+    """Write the prompt to a child's stdin and close it.
+
+    Claude may exit before reading the whole prompt (e.g. on an auth error); the
+    resulting broken pipe is ignored so its output can still be collected.
+    """
+    try:
+        stdin.write(prompt)
+    except BrokenPipeError:
+        logger.debug("Claude exited before reading the full prompt")
+    with contextlib.suppress(BrokenPipeError):
+        stdin.close()
+
 
 @dataclass
 class ClaudeResult:
@@ -31,8 +78,7 @@ class ClaudeResult:
         Returns:
             The value if found, None otherwise
         """
-        pattern = rf"{re.escape(key)}:\s*(\S+)"
-        match = re.search(pattern, self.output)
+        match = _key_re(key).search(self.output)
         return match.group(1) if match else None
 
     def extract_int(self, key: str) -> int | None:
@@ -47,7 +93,7 @@ class ClaudeResult:
         value = self.extract_value(key)
         if value:
             # Extract just the digits
-            digits = re.search(r"\d+", value)
+            digits = _DIGITS_RE.search(value)
             if digits:
                 return int(digits.group())
         return None
@@ -119,21 +165,7 @@ class ClaudeService:
     def check_dependencies(self) -> list[str]:
         """Check for required dependencies and return list of missing ones."""
         logger.debug("Checking claude CLI dependencies")
-        missing: list[str] = []
-
-        try:
-            result = subprocess.run(
-                ["claude", "--version"],
-                capture_output=True,
-                check=True,
-                text=True,
-            )
-            logger.debug(f"claude CLI version: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("claude CLI not found or not working")
-            missing.append("claude")
-
-        return missing
+        return list(_claude_missing(os.environ.get("PATH", "")))
 
     def ensure_dependencies(self) -> None:
         """Ensure all required dependencies are installed."""
@@ -145,12 +177,16 @@ class ClaudeService:
         self,
         prompt: str,
         workdir: Path | None = None,
+        on_line: Callable[[str], object] | None = None,
     ) -> ClaudeResult:
         """Run a prompt through Claude CLI.
 
         Args:
             prompt: The prompt to send to Claude
             workdir: Optional working directory
+            on_line: Optional callback invoked with each output line as it arrives
+                (e.g. sys.stdout.write for live verbose output). When set, stderr is
+                merged into stdout so lines are emitted in order.
 
         Returns:
             ClaudeResult with output and status
@@ -171,31 +207,70 @@ class ClaudeService:
         print_info(f"Running Claude with model: {self.model}")
 
         try:
-            result = subprocess.run(
-                cmd,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                cwd=workdir,
-                check=False,
-            )
-
-            success = result.returncode == 0
-            output = result.stdout + result.stderr
-            logger.info(f"Claude completed: exit_code={result.returncode}, success={success}")
-            log_subprocess_result(
-                logger, cmd, result.returncode, result.stdout, result.stderr, success=success
-            )
+            if on_line is not None:
+                returncode, stdout, stderr = self._run_streaming(cmd, prompt, workdir, on_line)
+            else:
+                result = subprocess.run(
+                    cmd,
+                    input=prompt,
+                    capture_output=True,
+                    text=True,
+                    cwd=workdir,
+                    check=False,
+                )
+                returncode, stdout, stderr = result.returncode, result.stdout, result.stderr
+
+            success = returncode == 0
+            output = stdout + stderr
+            logger.info(f"Claude completed: exit_code={returncode}, success={success}")
+            log_subprocess_result(logger, cmd, returncode, stdout, stderr, success=success)
 
             return ClaudeResult(
                 output=output,
-                exit_code=result.returncode,
+                exit_code=returncode,
                 success=success,
             )
-        except subprocess.SubprocessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             logger.exception("Failed to run Claude CLI")
             raise ClaudeError(f"Failed to run Claude CLI: {e}") from e
 
+    def _run_streaming(
+        self,
+        cmd: list[str],
+        prompt: str,
+        workdir: Path | None,
+        on_line: Callable[[str], object],
+    ) -> tuple[int, str, str]:
+        """Run Claude, forwarding each output line to on_line as it is produced.
+
+        Returns:
+            Tuple of (exit_code, stdout, stderr); stderr is always empty because it
+            is merged into stdout.
+        """
+        lines: list[str] = []
+        with subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            cwd=workdir,
+        ) as proc:
+            # Feed stdin from a thread so a large prompt cannot deadlock against a
+            # full stdout pipe while we are still writing
+            writer = threading.Thread(
+                target=_feed_stdin,
+                args=(proc.stdin, prompt),
+                daemon=True,
+            )
+            writer.start()
+            for line in proc.stdout:  # type: ignore[union-attr]
+                on_line(line)
+                lines.append(line)
+            writer.join()
+        return proc.returncode, "".join(lines), ""
+
     def create_tmux_command(
         self,
         prompt_file: Path,
@@ -218,35 +293,23 @@ class ClaudeService:
             Shell command string for tmux
         """
         # Build the claude command with streaming JSON output
-        claude_cmd_parts = [
-            "claude",
-            "--model",
-            self.model,
-            "--print",
-            "--output-format",
-            "stream-json",
-            "--verbose",
-        ]
-
-        if self.dangerously_skip_permissions:
-            claude_cmd_parts.append("--dangerously-skip-permissions")
-
-        claude_cmd = " ".join(claude_cmd_parts)
-
+        claude_cmd = _TMUX_CLAUDE_TMPL.format(
+            model=shlex.quote(self.model),
+            skip=" --dangerously-skip-permissions" if self.dangerously_skip_permissions else "",
+        )
+
+        fields = {
+            "prompt": shlex.quote(str(prompt_file)),
+            "claude": claude_cmd,
+            "output": shlex.quote(str(output_file)),
+            "exit": shlex.quote(str(exit_file)),
+        }
+        template = _TMUX_COMMAND_TMPL
         # If stream log file is provided, use tee to capture raw JSON stream
         if stream_log_file:
-            # Pipe through tee to capture raw stream, then write to output file
-            command = (
-                f"cat '{prompt_file}' | {claude_cmd} "
-                f"| tee '{stream_log_file}' > '{output_file}' 2>&1 ; "
-                f"echo $? > '{exit_file}'"
-            )
-        else:
-            # Just write to output file
-            command = (
-                f"cat '{prompt_file}' | {claude_cmd} > '{output_file}' 2>&1 ; "
-                f"echo $? > '{exit_file}'"
-            )
+            template = _TMUX_TEE_COMMAND_TMPL
+            fields["stream_log"] = shlex.quote(str(stream_log_file))
+        command = template.format(**fields)
 
         logger.debug(f"Created tmux command for Claude: {command}")
         logger.debug(f"  prompt_file: {prompt_file}")
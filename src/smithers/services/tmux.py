@@ -12,6 +12,7 @@ import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from shutil import which
 
 from smithers.console import (
     console,
@@ -73,17 +74,12 @@ class TmuxService:
 
         # Check script (used for capturing terminal output)
         # script is part of util-linux on Linux and bsdmainutils on macOS
-        try:
-            result = subprocess.run(
-                ["which", "script"],
-                capture_output=True,
-                check=True,
-                text=True,
-            )
-            logger.debug(f"script found at: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        script_path = which("script")
+        if script_path is None:
             logger.warning("script command not found")
             missing.append("script")
+        else:
+            logger.debug(f"script found at: {script_path}")
 
         return missing
 
@@ -98,18 +94,12 @@ class TmuxService:
         """
         if platform.system() != "Darwin":
             return False
-        try:
-            result = subprocess.run(
-                ["which", "caffeinate"],
-                capture_output=True,
-                check=True,
-                text=True,
-            )
-            logger.debug(f"caffeinate found at: {result.stdout.strip()}")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        caffeinate_path = which("caffeinate")
+        if caffeinate_path is None:
             logger.debug("caffeinate not found")
             return False
+        logger.debug(f"caffeinate found at: {caffeinate_path}")
+        return True
 
     def _wrap_with_caffeinate(self, command: str) -> str:
         """Wrap a command with caffeinate to prevent system sleep.
@@ -1,7 +1,11 @@
 """Version checking service for smithers."""
 
+import functools
 import json
+import re
 import subprocess
+import tempfile
+import threading
 import time
 from pathlib import Path
 from shutil import which
@@ -18,21 +22,32 @@ CACHE_TTL_SECONDS = 86400  # 24 hours
 
 GITHUB_API_URL = "https://api.github.com/repos/isaacmond/smithers/tags"
 
+_NUM_PREFIX_RE = re.compile(r"\d+")
 
+# In-process copy of (latest_version, checked_at) so repeated lookups skip file IO
+_MEM_CACHE: tuple[str, float] | None = None
+_MEM_CACHE_LOCK = threading.Lock()
+_refresh_in_flight = False
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_version(version_str: str) -> tuple[int, ...]:
     """Parse a version string into a tuple of integers for comparison."""
-    # Handle versions like "0.2.1" -> (0, 2, 1)
-    parts = []
-    for part in version_str.split("."):
-        # Strip any pre-release suffixes (e.g., "1.0.0a1" -> "1", "0", "0")
-        numeric = ""
-        for char in part:
-            if char.isdigit():
-                numeric += char
-            else:
-                break
-        parts.append(int(numeric) if numeric else 0)
-    return tuple(parts)
+    parts = version_str.split(".")
+    # Fast path for plain versions like "0.2.1" -> (0, 2, 1); int() alone would also
+    # accept signs, underscores and whitespace, so only all-ASCII-digit parts qualify
+    if all(part.isascii() and part.isdigit() for part in parts):
+        return tuple(map(int, parts))
+    # Strip any pre-release suffixes (e.g., "1.0.0a1" -> "1", "0", "0")
+    return tuple(int(m.group()) if (m := _NUM_PREFIX_RE.match(part)) else 0 for part in parts)
+
+
+def _safe_parse_version(version_str: str) -> tuple[int, ...] | None:
+    """Parse a version string, returning None if it is not a usable version."""
+    try:
+        return _parse_version(version_str) or None
+    except (ValueError, IndexError):
+        return None
 
 
 def _fetch_latest_version() -> str | None:
@@ -42,33 +57,21 @@ def _fetch_latest_version() -> str | None:
         request = Request(GITHUB_API_URL, headers={"User-Agent": "smithers-version-check"})
         with urlopen(request, timeout=3) as response:
             tags = json.loads(response.read().decode())
-            if not tags:
-                return None
-            # Find the highest version tag
-            versions = []
-            for tag in tags:
-                name = tag.get("name", "")
-                # Strip 'v' prefix if present (e.g., "v0.2.1" -> "0.2.1")
-                version_str = name.lstrip("v")
-                try:
-                    parsed = _parse_version(version_str)
-                    if parsed:  # Only include valid versions
-                        versions.append((parsed, version_str))
-                except (ValueError, IndexError):
-                    continue
-            if not versions:
-                return None
-            # Return the highest version
-            versions.sort(reverse=True, key=lambda x: x[0])
-            return versions[0][1]
+            # Strip 'v' prefix if present (e.g., "v0.2.1" -> "0.2.1")
+            names = (tag.get("name", "").lstrip("v") for tag in tags)
+            # Find the highest version tag in a single pass
+            best = max(
+                ((parsed, name) for name in names if (parsed := _safe_parse_version(name))),
+                key=lambda x: x[0],
+                default=None,
+            )
+            return best[1] if best else None
     except (URLError, TimeoutError, json.JSONDecodeError, KeyError):
         return None
 
 
 def _read_cache() -> dict | None:
-    """Read the version cache file."""
-    if not VERSION_CACHE_FILE.exists():
-        return None
+    """Read the version cache file; a missing file is handled like an unreadable one."""
     try:
         return json.loads(VERSION_CACHE_FILE.read_text())
     except (json.JSONDecodeError, OSError):
@@ -76,29 +79,82 @@ def _read_cache() -> dict | None:
 
 
 def _write_cache(latest_version: str) -> None:
-    """Write the version cache file."""
+    """Write the version cache file and the in-process cache."""
+    global _MEM_CACHE  # noqa: PLW0603
+    checked_at = time.time()
+    with _MEM_CACHE_LOCK:
+        _MEM_CACHE = (latest_version, checked_at)
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         cache_data = {
             "latest_version": latest_version,
-            "checked_at": time.time(),
+            "checked_at": checked_at,
         }
-        VERSION_CACHE_FILE.write_text(json.dumps(cache_data))
+        # Write to a uniquely named temp file and rename so readers never see a
+        # truncated cache, even with concurrent writers (threads or processes)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=VERSION_CACHE_FILE.parent, prefix="version_cache.", suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_path = Path(tmp_file.name)
+            try:
+                tmp_file.write(json.dumps(cache_data, separators=(",", ":")))
+                tmp_file.close()
+                tmp_path.replace(VERSION_CACHE_FILE)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
     except OSError:
         pass  # Silently ignore cache write failures
 
 
+def _refresh_in_background() -> None:
+    """Fetch the latest version and update the caches (daemon thread target)."""
+    global _refresh_in_flight  # noqa: PLW0603
+    try:
+        latest = _fetch_latest_version()
+        if latest:
+            _write_cache(latest)
+    finally:
+        with _MEM_CACHE_LOCK:
+            _refresh_in_flight = False
+
+
+def _start_background_refresh() -> None:
+    """Start a background refresh unless one is already running."""
+    global _refresh_in_flight  # noqa: PLW0603
+    with _MEM_CACHE_LOCK:
+        if _refresh_in_flight:
+            return
+        _refresh_in_flight = True
+    threading.Thread(target=_refresh_in_background, daemon=True).start()
+
+
 def get_latest_version() -> str | None:
-    """Get the latest version, using cache if available and fresh."""
-    cache = _read_cache()
-    if cache:
-        checked_at = cache.get("checked_at", 0)
-        if time.time() - checked_at < CACHE_TTL_SECONDS:
-            return cache.get("latest_version")
-
-    latest = _fetch_latest_version()
-    if latest:
-        _write_cache(latest)
+    """Get the latest version, using cache if available.
+
+    A stale cached version is returned immediately while a background thread
+    refreshes it (stale-while-revalidate). Only a cold cache blocks on the network.
+    """
+    global _MEM_CACHE  # noqa: PLW0603
+    with _MEM_CACHE_LOCK:
+        cached = _MEM_CACHE
+
+    if cached is None:
+        cache = _read_cache()
+        if cache and cache.get("latest_version"):
+            cached = (cache["latest_version"], cache.get("checked_at", 0))
+            with _MEM_CACHE_LOCK:
+                _MEM_CACHE = cached
+
+    if cached is None:
+        latest = _fetch_latest_version()
+        if latest:
+            _write_cache(latest)
+        return latest
+
+    latest, checked_at = cached
+    if time.time() - checked_at >= CACHE_TTL_SECONDS:
+        _start_background_refresh()
     return latest
 
 
@@ -4,8 +4,10 @@ from pathlib import Path
 
 import pytest
 
+from smithers.models.todo import TodoFile
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_todo_content() -> str:
     """Return sample TODO file content for testing."""
     return """# Implementation Plan: Test Feature
@@ -58,18 +60,33 @@ This is a test implementation plan.
 """
 
 
-@pytest.fixture
-def sample_todo_file(tmp_path: Path, sample_todo_content: str) -> Path:
-    """Create a sample TODO file and return its path."""
-    todo_file = tmp_path / "test-todo.md"
+@pytest.fixture(scope="session")
+def parsed_sample_todo(sample_todo_content: str) -> TodoFile:
+    """Parse the sample TODO content once per session.
+
+    Tests must treat the parsed TodoFile as read-only.
+    """
+    return TodoFile.parse_content(sample_todo_content)
+
+
+@pytest.fixture(scope="session")
+def sample_todo_file(tmp_path_factory: pytest.TempPathFactory, sample_todo_content: str) -> Path:
+    """Create a sample TODO file once per session and return its path.
+
+    Tests must treat the file as read-only.
+    """
+    todo_file = tmp_path_factory.mktemp("todo") / "test-todo.md"
     todo_file.write_text(sample_todo_content)
     return todo_file
 
 
-@pytest.fixture
-def sample_design_doc(tmp_path: Path) -> Path:
-    """Create a sample design document and return its path."""
-    design_doc = tmp_path / "design.md"
+@pytest.fixture(scope="session")
+def sample_design_doc(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample design document once per session and return its path.
+
+    Tests must treat the file as read-only.
+    """
+    design_doc = tmp_path_factory.mktemp("design") / "design.md"
     design_doc.write_text("""# Test Feature Design
 
 ## Overview
@@ -83,3 +100,9 @@ This is a test design document.
 Details here...
 """)
     return design_doc
+
+
+@pytest.fixture(scope="session")
+def session_tmp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a temporary directory shared by every test in the session."""
+    return tmp_path_factory.mktemp("session")
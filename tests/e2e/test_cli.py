@@ -12,11 +12,23 @@ from smithers.commands.quote import SMITHERS_QUOTES
 
 runner = CliRunner()
 
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
 
 def strip_ansi(text: str) -> str:
     """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r"\x1b\[[0-9;]*m")
-    return ansi_escape.sub("", text)
+    return _ANSI_RE.sub("", text)
+
+
+@pytest.fixture(scope="module")
+def help_output() -> dict[str, tuple[int, str]]:
+    """Invoke --help once per command and share (exit_code, output) across tests."""
+    results = {}
+    for command in ("", "implement", "fix", "update"):
+        args = [command, "--help"] if command else ["--help"]
+        result = runner.invoke(app, args)
+        results[command] = (result.exit_code, strip_ansi(result.stdout))
+    return results
 
 
 class TestCLI:
@@ -28,37 +40,36 @@ class TestCLI:
         assert result.exit_code == 0
         assert __version__ in result.stdout
 
-    def test_help(self) -> None:
+    @pytest.mark.parametrize("command", ["", "implement", "fix", "update"])
+    def test_help_exit_code(self, help_output: dict[str, tuple[int, str]], command: str) -> None:
+        """Test --help exits cleanly for the app and each command."""
+        exit_code, _ = help_output[command]
+        assert exit_code == 0
+
+    def test_help(self, help_output: dict[str, tuple[int, str]]) -> None:
         """Test --help flag."""
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "implement" in result.stdout
-        assert "fix" in result.stdout
-        assert "update" in result.stdout
+        _, output = help_output[""]
+        assert "implement" in output
+        assert "fix" in output
+        assert "update" in output
         # Note: "quote" is a hidden command and should not appear in help
 
-    def test_implement_help(self) -> None:
+    def test_implement_help(self, help_output: dict[str, tuple[int, str]]) -> None:
         """Test implement command help."""
-        result = runner.invoke(app, ["implement", "--help"])
-        assert result.exit_code == 0
-        output = strip_ansi(result.stdout)
+        _, output = help_output["implement"]
         assert "design document" in output.lower()
         assert "--base" in output
         assert "--model" in output
 
-    def test_fix_help(self) -> None:
+    def test_fix_help(self, help_output: dict[str, tuple[int, str]]) -> None:
         """Test fix command help."""
-        result = runner.invoke(app, ["fix", "--help"])
-        assert result.exit_code == 0
-        output = strip_ansi(result.stdout)
+        _, output = help_output["fix"]
         assert "PR" in output
         assert "--model" in output
 
-    def test_update_help(self) -> None:
+    def test_update_help(self, help_output: dict[str, tuple[int, str]]) -> None:
         """Test update command help."""
-        result = runner.invoke(app, ["update", "--help"])
-        assert result.exit_code == 0
-        output = strip_ansi(result.stdout)
+        _, output = help_output["update"]
         assert "update" in output.lower()
         assert "uv tool upgrade smithers" in output
 
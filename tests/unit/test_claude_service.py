@@ -0,0 +1,171 @@
+"""Unit tests for the Claude CLI service."""
+
+import os
+import shlex
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from smithers.exceptions import ClaudeError
+from smithers.services import claude as claude_module
+from smithers.services.claude import ClaudeService
+
+# Paths with a space and a single quote, which the tmux command must quote
+PROMPT_FILE = Path("/tmp/smithers run/it's prompt.md")
+OUTPUT_FILE = Path("/tmp/smithers run/it's output.txt")
+EXIT_FILE = Path("/tmp/smithers run/it's exit.txt")
+STREAM_LOG_FILE = Path("/tmp/smithers run/it's stream.jsonl")
+
+# Large enough to overflow any OS pipe buffer
+LARGE_PROMPT = "prompt line\n" * 100_000
+
+
+@pytest.fixture
+def stub_claude(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put an empty stub `claude` script first on PATH and return its path."""
+    script = tmp_path / "claude"
+    script.touch(mode=0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+@pytest.fixture
+def fresh_probe() -> Iterator[None]:
+    """Clear the memoized claude CLI probe around the test so results don't leak."""
+    claude_module._claude_missing.cache_clear()  # noqa: SLF001
+    yield
+    claude_module._claude_missing.cache_clear()  # noqa: SLF001
+
+
+class TestRunPromptStreaming:
+    """Tests for ClaudeService.run_prompt with an on_line callback."""
+
+    def test_forwards_each_line(self, stub_claude: Path) -> None:
+        """Test that every output line is forwarded to on_line and kept in the output."""
+        # Echoes stdin back while reading it, so a large prompt also checks for deadlock
+        stub_claude.write_text("#!/bin/sh\ncat\necho done\n")
+        lines: list[str] = []
+
+        result = ClaudeService().run_prompt(LARGE_PROMPT, on_line=lines.append)
+
+        assert result.success is True
+        assert lines[0] == "prompt line\n"
+        assert lines[-1] == "done\n"
+        assert len(lines) == 100_001
+        assert result.output == LARGE_PROMPT + "done\n"
+
+    def test_early_exit_returns_failed_result(self, stub_claude: Path) -> None:
+        """Test that Claude exiting before reading the prompt yields a failed result."""
+        stub_claude.write_text("#!/bin/sh\necho auth error >&2\nexit 1\n")
+        lines: list[str] = []
+
+        result = ClaudeService().run_prompt(LARGE_PROMPT, on_line=lines.append)
+
+        assert result.success is False
+        assert result.exit_code == 1
+        assert lines == ["auth error\n"]
+        assert "auth error" in result.output
+
+    def test_missing_cli_raises_claude_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that failing to start the CLI is reported as a ClaudeError."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        with pytest.raises(ClaudeError, match="Failed to run Claude CLI"):
+            ClaudeService().run_prompt("prompt", on_line=lambda _: None)
+
+
+@pytest.mark.usefixtures("fresh_probe")
+class TestCheckDependencies:
+    """Tests for ClaudeService.check_dependencies."""
+
+    @pytest.mark.usefixtures("stub_claude")
+    def test_found_on_path(self) -> None:
+        """Test that nothing is reported missing when claude is on PATH."""
+        assert ClaudeService().check_dependencies() == []
+
+    def test_missing_from_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that claude is reported missing when it is not on PATH."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert ClaudeService().check_dependencies() == ["claude"]
+
+    def test_path_change_probes_again(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a new PATH value is probed instead of reusing the cached result."""
+        empty_dir = tmp_path / "empty"
+        empty_dir.mkdir()
+        monkeypatch.setenv("PATH", str(empty_dir))
+        assert ClaudeService().check_dependencies() == ["claude"]
+
+        (tmp_path / "claude").touch(mode=0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{empty_dir}")
+
+        assert ClaudeService().check_dependencies() == []
+
+
+class TestCreateTmuxCommand:
+    """Tests for ClaudeService.create_tmux_command."""
+
+    def test_quotes_paths_and_model(self) -> None:
+        """Test that the model and paths survive shell parsing unchanged."""
+        service = ClaudeService(model="custom-model", dangerously_skip_permissions=False)
+
+        command = service.create_tmux_command(PROMPT_FILE, OUTPUT_FILE, EXIT_FILE)
+
+        assert shlex.split(command) == [
+            "cat",
+            str(PROMPT_FILE),
+            "|",
+            "claude",
+            "--model",
+            "custom-model",
+            "--print",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            ">",
+            str(OUTPUT_FILE),
+            "2>&1",
+            ";",
+            "echo",
+            "$?",
+            ">",
+            str(EXIT_FILE),
+        ]
+
+    def test_quotes_stream_log_with_tee(self) -> None:
+        """Test that the tee variant also quotes the stream log path."""
+        service = ClaudeService(model="custom-model")
+
+        command = service.create_tmux_command(
+            PROMPT_FILE, OUTPUT_FILE, EXIT_FILE, stream_log_file=STREAM_LOG_FILE
+        )
+
+        assert shlex.split(command) == [
+            "cat",
+            str(PROMPT_FILE),
+            "|",
+            "claude",
+            "--model",
+            "custom-model",
+            "--print",
+            "--output-format",
+            "stream-json",
+            "--verbose",
+            "--dangerously-skip-permissions",
+            "|",
+            "tee",
+            str(STREAM_LOG_FILE),
+            ">",
+            str(OUTPUT_FILE),
+            "2>&1",
+            ";",
+            "echo",
+            "$?",
+            ">",
+            str(EXIT_FILE),
+        ]
@@ -0,0 +1,90 @@
+"""Unit tests for the console output helpers."""
+
+import io
+from collections.abc import Callable
+
+import pytest
+from rich.console import Console
+
+from smithers import console as console_module
+from smithers.console import print_error, print_header, print_warning
+
+# Box-drawing characters Rich uses for Panel borders
+PANEL_CHARS = "╭╮╰╯│─"
+
+
+@pytest.fixture
+def output(monkeypatch: pytest.MonkeyPatch) -> Callable[..., io.StringIO]:
+    """Return a factory that swaps in a console writing to a StringIO buffer."""
+    monkeypatch.delenv("NO_COLOR", raising=False)
+
+    def make_console(*, terminal: bool, no_color: bool = False) -> io.StringIO:
+        if no_color:
+            monkeypatch.setenv("NO_COLOR", "1")
+        buffer = io.StringIO()
+        monkeypatch.setattr(
+            console_module, "console", Console(file=buffer, force_terminal=terminal, width=80)
+        )
+        return buffer
+
+    return make_console
+
+
+PLAIN_MODES = [
+    pytest.param({"terminal": False}, id="not-a-terminal"),
+    pytest.param({"terminal": True, "no_color": True}, id="no-color"),
+]
+
+
+class TestPlainOutput:
+    """Tests for the plain-text fallback used off a colored terminal."""
+
+    @pytest.mark.parametrize("mode", PLAIN_MODES)
+    def test_header_has_no_panel(
+        self, output: Callable[..., io.StringIO], mode: dict[str, bool]
+    ) -> None:
+        """Test that print_header emits a plain '=== title ===' line."""
+        buffer = output(**mode)
+
+        print_header("Planning")
+
+        text = buffer.getvalue()
+        assert "=== Planning ===" in text
+        assert not any(char in text for char in PANEL_CHARS)
+
+    @pytest.mark.parametrize("mode", PLAIN_MODES)
+    @pytest.mark.parametrize(
+        ("printer", "prefix"),
+        [
+            pytest.param(print_error, "Error: ", id="error"),
+            pytest.param(print_warning, "Warning: ", id="warning"),
+        ],
+    )
+    def test_keeps_prefix(
+        self,
+        output: Callable[..., io.StringIO],
+        mode: dict[str, bool],
+        printer: Callable[[str], None],
+        prefix: str,
+    ) -> None:
+        """Test that errors and warnings keep their prefix in plain output."""
+        buffer = output(**mode)
+
+        printer("something broke")
+
+        assert buffer.getvalue() == f"{prefix}something broke\n"
+
+
+class TestRichOutput:
+    """Tests for Rich rendering on a colored terminal."""
+
+    def test_header_uses_panel(self, output: Callable[..., io.StringIO]) -> None:
+        """Test that print_header draws a Panel on a colored terminal."""
+        buffer = output(terminal=True)
+
+        print_header("Planning")
+
+        text = buffer.getvalue()
+        assert "Planning" in text
+        assert "===" not in text
+        assert "╭" in text
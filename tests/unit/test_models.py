@@ -1,39 +1,96 @@
 """Tests for data models."""
 
+import pytest
+
+from smithers.models import config as config_module
 from smithers.models.config import Config, set_config
 from smithers.models.stage import Stage, StageStatus
 from smithers.services.claude import ClaudeResult
 
+SAMPLE_STAGE_DICT: dict[str, object] = {
+    "number": 1,
+    "title": "Test Stage",
+    "branch": "feature/test",
+    "parallel_group": "1",
+    "description": "A test stage",
+    "status": "pending",
+    "depends_on": "Stage 0",
+    "pr_number": 123,
+    "files": ["file1.py", "file2.py"],
+    "acceptance_criteria": ["Criterion 1", "Criterion 2"],
+}
+
+SAMPLE_CLAUDE_OUTPUT = "TODO_FILE_CREATED: /path/to/file.md\nNUM_STAGES: 5\nPR_NUMBER: #123"
+
+
+@pytest.fixture(scope="module")
+def default_config() -> Config:
+    """Return a Config with only the required field set."""
+    return Config(branch_prefix="user/")
+
+
+@pytest.fixture(scope="module")
+def custom_config() -> Config:
+    """Return a Config with every field overridden."""
+    return Config(
+        branch_prefix="feature/",
+        base_branch="develop",
+        poll_interval=10.0,
+        dry_run=True,
+        verbose=True,
+    )
+
+
+@pytest.fixture
+def isolated_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the global config set by set_config once the test finishes."""
+    monkeypatch.setattr(config_module, "_config", None)
+
+
+@pytest.fixture(scope="module")
+def stage_from_dict() -> Stage:
+    """Return a Stage built from SAMPLE_STAGE_DICT."""
+    return Stage.from_dict(SAMPLE_STAGE_DICT)
+
+
+@pytest.fixture(scope="module")
+def claude_result() -> ClaudeResult:
+    """Return a successful ClaudeResult wrapping SAMPLE_CLAUDE_OUTPUT."""
+    return ClaudeResult(output=SAMPLE_CLAUDE_OUTPUT, exit_code=0, success=True)
+
 
 class TestConfig:
     """Tests for the Config model."""
 
-    def test_default_config(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("branch_prefix", "user/"),
+            ("base_branch", "main"),
+            ("poll_interval", 5.0),
+            ("dry_run", False),
+            ("verbose", False),
+        ],
+    )
+    def test_default_config(self, default_config: Config, attr: str, expected: object) -> None:
         """Test default configuration values."""
-        config = Config(branch_prefix="user/")
-
-        assert config.branch_prefix == "user/"
-        assert config.base_branch == "main"
-        assert config.poll_interval == 5.0
-        assert config.dry_run is False
-        assert config.verbose is False
-
-    def test_custom_config(self) -> None:
+        assert getattr(default_config, attr) == expected
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("branch_prefix", "feature/"),
+            ("base_branch", "develop"),
+            ("poll_interval", 10.0),
+            ("dry_run", True),
+            ("verbose", True),
+        ],
+    )
+    def test_custom_config(self, custom_config: Config, attr: str, expected: object) -> None:
         """Test custom configuration values."""
-        config = Config(
-            branch_prefix="feature/",
-            base_branch="develop",
-            poll_interval=10.0,
-            dry_run=True,
-            verbose=True,
-        )
-
-        assert config.branch_prefix == "feature/"
-        assert config.base_branch == "develop"
-        assert config.poll_interval == 10.0
-        assert config.dry_run is True
-        assert config.verbose is True
+        assert getattr(custom_config, attr) == expected
 
+    @pytest.mark.usefixtures("isolated_config")
     def test_set_config(self) -> None:
         """Test setting global config."""
         config = Config(branch_prefix="test/")
@@ -45,33 +102,24 @@ class TestConfig:
 class TestStage:
     """Tests for the Stage model."""
 
-    def test_stage_from_dict(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("number", 1),
+            ("title", "Test Stage"),
+            ("branch", "feature/test"),
+            ("parallel_group", "1"),
+            ("description", "A test stage"),
+            ("status", StageStatus.PENDING),
+            ("depends_on", "Stage 0"),
+            ("pr_number", 123),
+            ("files", ["file1.py", "file2.py"]),
+            ("acceptance_criteria", ["Criterion 1", "Criterion 2"]),
+        ],
+    )
+    def test_stage_from_dict(self, stage_from_dict: Stage, attr: str, expected: object) -> None:
         """Test creating a Stage from a dictionary."""
-        data = {
-            "number": 1,
-            "title": "Test Stage",
-            "branch": "feature/test",
-            "parallel_group": "1",
-            "description": "A test stage",
-            "status": "pending",
-            "depends_on": "Stage 0",
-            "pr_number": 123,
-            "files": ["file1.py", "file2.py"],
-            "acceptance_criteria": ["Criterion 1", "Criterion 2"],
-        }
-
-        stage = Stage.from_dict(data)
-
-        assert stage.number == 1
-        assert stage.title == "Test Stage"
-        assert stage.branch == "feature/test"
-        assert stage.parallel_group == "1"
-        assert stage.description == "A test stage"
-        assert stage.status == StageStatus.PENDING
-        assert stage.depends_on == "Stage 0"
-        assert stage.pr_number == 123
-        assert stage.files == ["file1.py", "file2.py"]
-        assert stage.acceptance_criteria == ["Criterion 1", "Criterion 2"]
+        assert getattr(stage_from_dict, attr) == expected
 
     def test_stage_status_enum(self) -> None:
         """Test StageStatus enum values."""
@@ -83,25 +131,59 @@ class TestStage:
 class TestClaudeResult:
     """Tests for the ClaudeResult model."""
 
-    def test_extract_value(self) -> None:
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("TODO_FILE_CREATED", "/path/to/file.md"),
+            ("NUM_STAGES", "5"),
+            ("NONEXISTENT", None),
+        ],
+    )
+    def test_extract_value(
+        self, claude_result: ClaudeResult, key: str, expected: str | None
+    ) -> None:
         """Test extracting values from output."""
+        assert claude_result.extract_value(key) == expected
+
+    def test_extract_value_not_at_line_start(self) -> None:
+        """Test extracting a value that does not start its line."""
         result = ClaudeResult(
-            output="TODO_FILE_CREATED: /path/to/file.md\nNUM_STAGES: 3",
+            output="Done. TODO_FILE_CREATED: /path/to/file.md\nNUM_STAGES: 2",
             exit_code=0,
             success=True,
         )
 
         assert result.extract_value("TODO_FILE_CREATED") == "/path/to/file.md"
-        assert result.extract_value("NONEXISTENT") is None
-
-    def test_extract_int(self) -> None:
+        assert result.extract_value("NUM_STAGES") == "2"
+
+    @pytest.mark.parametrize(
+        ("output", "key", "expected"),
+        [
+            pytest.param(
+                "Writing TODO_FILE_CREATED: /a.md now\nTODO_FILE_CREATED: /b.md",
+                "TODO_FILE_CREATED",
+                "/a.md",
+                id="mid-line-before-line-start",
+            ),
+            pytest.param("NUM_STAGES: 5\nSTAGES: 3", "STAGES", "5", id="suffix-of-earlier-key"),
+        ],
+    )
+    def test_extract_value_leftmost_occurrence_wins(
+        self, output: str, key: str, expected: str
+    ) -> None:
+        """Test that the leftmost occurrence of a key wins, wherever it is on its line."""
+        result = ClaudeResult(output=output, exit_code=0, success=True)
+
+        assert result.extract_value(key) == expected
+
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [
+            ("NUM_STAGES", 5),
+            ("PR_NUMBER", 123),
+            ("MISSING", None),
+        ],
+    )
+    def test_extract_int(self, claude_result: ClaudeResult, key: str, expected: int | None) -> None:
         """Test extracting integer values."""
-        result = ClaudeResult(
-            output="NUM_STAGES: 5\nPR_NUMBER: #123",
-            exit_code=0,
-            success=True,
-        )
-
-        assert result.extract_int("NUM_STAGES") == 5
-        assert result.extract_int("PR_NUMBER") == 123
-        assert result.extract_int("MISSING") is None
+        assert claude_result.extract_int(key) == expected
@@ -1,13 +1,123 @@
 """Tests for the TODO file parser."""
 
+import re
 from pathlib import Path
 
 import pytest
 
 from smithers.exceptions import TodoParseError
-from smithers.models.stage import StageStatus
+from smithers.models.stage import Stage, StageStatus
 from smithers.models.todo import TodoFile
 
+_NOT_FOUND_RE = re.compile("not found")
+
+STAGES_MIXED_STATUSES = [
+    Stage(
+        number=1,
+        title="Done",
+        branch="branch-1",
+        parallel_group="1",
+        description="",
+        status=StageStatus.COMPLETED,
+        pr_number=100,
+    ),
+    Stage(
+        number=2,
+        title="In Progress",
+        branch="branch-2",
+        parallel_group="1",
+        description="",
+        status=StageStatus.IN_PROGRESS,
+    ),
+    Stage(
+        number=3,
+        title="Pending",
+        branch="branch-3",
+        parallel_group="2",
+        description="",
+        status=StageStatus.PENDING,
+    ),
+]
+
+STAGES_ALL_COMPLETED = [
+    Stage(
+        number=1,
+        title="Done",
+        branch="branch-1",
+        parallel_group="1",
+        description="",
+        status=StageStatus.COMPLETED,
+        pr_number=100,
+    ),
+    Stage(
+        number=2,
+        title="Also Done",
+        branch="branch-2",
+        parallel_group="1",
+        description="",
+        status=StageStatus.COMPLETED,
+        pr_number=101,
+    ),
+]
+
+CONTENT_MINIMAL_STAGE = """# Plan
+
+## Stages
+
+### Stage 1: Minimal
+- **Branch**: minimal-branch
+- **Parallel group**: 1
+"""
+
+CONTENT_COMPLETED_STATUS = """# Plan
+
+## Stages
+
+### Stage 1: Done
+- **Status**: completed
+- **Branch**: done-branch
+- **Parallel group**: 1
+- **PR**: #123
+"""
+
+CONTENT_MIXED_STATUSES = """# Plan
+
+## Stages
+
+### Stage 1: Done
+- **Status**: completed
+- **Branch**: branch-1
+- **Parallel group**: 1
+- **PR**: #100
+
+### Stage 2: In Progress
+- **Status**: in_progress
+- **Branch**: branch-2
+- **Parallel group**: 1
+
+### Stage 3: Pending
+- **Status**: pending
+- **Branch**: branch-3
+- **Parallel group**: 2
+"""
+
+CONTENT_ALL_COMPLETED = """# Plan
+
+## Stages
+
+### Stage 1: Done
+- **Status**: completed
+- **Branch**: branch-1
+- **Parallel group**: 1
+- **PR**: #100
+
+### Stage 2: Also Done
+- **Status**: completed
+- **Branch**: branch-2
+- **Parallel group**: 1
+- **PR**: #101
+"""
+
 
 class TestTodoFileParsing:
     """Tests for TodoFile.parse and TodoFile.parse_content."""
@@ -20,22 +130,20 @@ class TestTodoFileParsing:
         assert "Test Feature" in todo.title
         assert len(todo.stages) == 3
 
-    def test_parse_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_parse_nonexistent_file(self, session_tmp_dir: Path) -> None:
         """Test that parsing a nonexistent file raises an error."""
-        with pytest.raises(TodoParseError, match="not found"):
-            TodoFile.parse(tmp_path / "nonexistent.md")
+        with pytest.raises(TodoParseError, match=_NOT_FOUND_RE):
+            TodoFile.parse(session_tmp_dir / "nonexistent.md")
 
-    def test_parse_content(self, sample_todo_content: str) -> None:
+    def test_parse_content(self, parsed_sample_todo: TodoFile) -> None:
         """Test parsing TODO content directly."""
-        todo = TodoFile.parse_content(sample_todo_content)
-
-        assert "Test Feature" in todo.title
-        assert "Testing the TODO parser" in todo.overview
-        assert len(todo.stages) == 3
+        assert "Test Feature" in parsed_sample_todo.title
+        assert "Testing the TODO parser" in parsed_sample_todo.overview
+        assert len(parsed_sample_todo.stages) == 3
 
-    def test_parse_stages(self, sample_todo_content: str) -> None:
+    def test_parse_stages(self, parsed_sample_todo: TodoFile) -> None:
         """Test that stages are parsed correctly."""
-        todo = TodoFile.parse_content(sample_todo_content)
+        todo = parsed_sample_todo
 
         # Stage 1
         stage1 = todo.stages[0]
@@ -64,10 +172,9 @@ class TestTodoFileParsing:
         assert stage3.depends_on is not None
         assert "Stage 1" in stage3.depends_on
 
-    def test_parse_notes(self, sample_todo_content: str) -> None:
+    def test_parse_notes(self, parsed_sample_todo: TodoFile) -> None:
         """Test that notes section is parsed."""
-        todo = TodoFile.parse_content(sample_todo_content)
-        assert "test implementation plan" in todo.notes
+        assert "test implementation plan" in parsed_sample_todo.notes
 
 
 class TestEdgeCases:
@@ -81,96 +188,51 @@ class TestEdgeCases:
 
     def test_minimal_stage(self) -> None:
         """Test parsing a minimal stage definition."""
-        content = """# Plan
-
-## Stages
-
-### Stage 1: Minimal
-- **Branch**: minimal-branch
-- **Parallel group**: 1
-"""
-        todo = TodoFile.parse_content(content)
+        todo = TodoFile.parse_content(CONTENT_MINIMAL_STAGE)
         assert len(todo.stages) == 1
         assert todo.stages[0].branch == "minimal-branch"
 
     def test_completed_status(self) -> None:
         """Test parsing completed status."""
-        content = """# Plan
-
-## Stages
-
-### Stage 1: Done
-- **Status**: completed
-- **Branch**: done-branch
-- **Parallel group**: 1
-- **PR**: #123
-"""
-        todo = TodoFile.parse_content(content)
+        todo = TodoFile.parse_content(CONTENT_COMPLETED_STATUS)
         assert todo.stages[0].status == StageStatus.COMPLETED
         assert todo.stages[0].pr_number == 123
 
+    @pytest.mark.parametrize(
+        ("content", "expected_stages"),
+        [
+            pytest.param(CONTENT_MIXED_STATUSES, STAGES_MIXED_STATUSES, id="mixed"),
+            pytest.param(CONTENT_ALL_COMPLETED, STAGES_ALL_COMPLETED, id="all-completed"),
+        ],
+    )
+    def test_parse_statuses(self, content: str, expected_stages: list[Stage]) -> None:
+        """Test parsing several stages with differing statuses into Stage objects."""
+        todo = TodoFile.parse_content(content)
+
+        assert todo.stages == expected_stages
+
 
 class TestTodoFileFiltering:
     """Tests for TodoFile filtering methods."""
 
-    def test_get_completed_stages_none(self, sample_todo_content: str) -> None:
+    def test_get_completed_stages_none(self, parsed_sample_todo: TodoFile) -> None:
         """Test get_completed_stages when no stages are completed."""
-        todo = TodoFile.parse_content(sample_todo_content)
-
-        completed = todo.get_completed_stages()
+        completed = parsed_sample_todo.get_completed_stages()
 
         assert len(completed) == 0
 
-    def test_get_completed_stages_some(self) -> None:
-        """Test get_completed_stages with mixed statuses."""
-        content = """# Plan
-
-## Stages
-
-### Stage 1: Done
-- **Status**: completed
-- **Branch**: branch-1
-- **Parallel group**: 1
-- **PR**: #100
-
-### Stage 2: In Progress
-- **Status**: in_progress
-- **Branch**: branch-2
-- **Parallel group**: 1
-
-### Stage 3: Pending
-- **Status**: pending
-- **Branch**: branch-3
-- **Parallel group**: 2
-"""
-        todo = TodoFile.parse_content(content)
-
-        completed = todo.get_completed_stages()
-
-        assert len(completed) == 1
-        assert completed[0].number == 1
-        assert completed[0].status == StageStatus.COMPLETED
-
-    def test_get_completed_stages_all(self) -> None:
-        """Test get_completed_stages when all are completed."""
-        content = """# Plan
-
-## Stages
-
-### Stage 1: Done
-- **Status**: completed
-- **Branch**: branch-1
-- **Parallel group**: 1
-- **PR**: #100
-
-### Stage 2: Also Done
-- **Status**: completed
-- **Branch**: branch-2
-- **Parallel group**: 1
-- **PR**: #101
-"""
-        todo = TodoFile.parse_content(content)
+    @pytest.mark.parametrize(
+        ("stages", "expected_numbers"),
+        [
+            pytest.param(STAGES_MIXED_STATUSES, [1], id="some"),
+            pytest.param(STAGES_ALL_COMPLETED, [1, 2], id="all"),
+        ],
+    )
+    def test_get_completed_stages(self, stages: list[Stage], expected_numbers: list[int]) -> None:
+        """Test get_completed_stages returns only completed stages, in order."""
+        todo = TodoFile(path=Path("todo.md"), title="Plan", overview="", stages=stages)
 
         completed = todo.get_completed_stages()
 
-        assert len(completed) == 2
+        assert [stage.number for stage in completed] == expected_numbers
+        assert all(stage.status is StageStatus.COMPLETED for stage in completed)
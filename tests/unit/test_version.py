@@ -0,0 +1,168 @@
+"""Unit tests for the version check cache."""
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from smithers.services import version as version_module
+from smithers.services.version import CACHE_TTL_SECONDS, _parse_version, get_latest_version
+
+CACHED_VERSION = "1.0.0"
+FETCHED_VERSION = "9.9.9"
+
+
+class FakeFetch:
+    """Stand-in for _fetch_latest_version that counts calls and can block."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self) -> str:
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return FETCHED_VERSION
+
+
+@pytest.fixture
+def cache_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the version cache at tmp_path and reset the in-process caches."""
+    cache_file = tmp_path / "version_cache.json"
+    monkeypatch.setattr(version_module, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(version_module, "VERSION_CACHE_FILE", cache_file)
+    monkeypatch.setattr(version_module, "_MEM_CACHE", None)
+    monkeypatch.setattr(version_module, "_refresh_in_flight", False)
+    return cache_file
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch: pytest.MonkeyPatch) -> FakeFetch:
+    """Replace the GitHub lookup with a FakeFetch."""
+    fetch = FakeFetch()
+    monkeypatch.setattr(version_module, "_fetch_latest_version", fetch)
+    return fetch
+
+
+@pytest.fixture
+def refresh_threads(monkeypatch: pytest.MonkeyPatch) -> list[threading.Thread]:
+    """Record every thread started by the version module so tests can join them."""
+    threads: list[threading.Thread] = []
+    real_thread = threading.Thread
+
+    def make_thread(*args: object, **kwargs: object) -> threading.Thread:
+        thread = real_thread(*args, **kwargs)
+        threads.append(thread)
+        return thread
+
+    # Swap the module's own view of threading so the stdlib module stays untouched
+    monkeypatch.setattr(
+        version_module, "threading", SimpleNamespace(Thread=make_thread, Lock=threading.Lock)
+    )
+    return threads
+
+
+def write_cache(cache_file: Path, age_seconds: float) -> None:
+    """Write a cache file holding CACHED_VERSION checked age_seconds ago."""
+    cache_file.write_text(
+        json.dumps({"latest_version": CACHED_VERSION, "checked_at": time.time() - age_seconds})
+    )
+
+
+def read_cached_version(cache_file: Path) -> str:
+    """Return the latest_version stored in the cache file."""
+    return json.loads(cache_file.read_text())["latest_version"]
+
+
+class TestGetLatestVersion:
+    """Tests for get_latest_version's cache handling."""
+
+    def test_cold_cache_fetches_and_writes(
+        self,
+        cache_file: Path,
+        fake_fetch: FakeFetch,
+        refresh_threads: list[threading.Thread],
+    ) -> None:
+        """Test that a cold cache blocks on the fetch and writes the result."""
+        assert get_latest_version() == FETCHED_VERSION
+
+        assert fake_fetch.calls == 1
+        assert refresh_threads == []
+        assert read_cached_version(cache_file) == FETCHED_VERSION
+        assert list(cache_file.parent.glob("*.tmp")) == []
+
+    def test_fresh_cache_skips_fetch(
+        self,
+        cache_file: Path,
+        fake_fetch: FakeFetch,
+        refresh_threads: list[threading.Thread],
+    ) -> None:
+        """Test that a fresh cache is returned without fetching."""
+        write_cache(cache_file, age_seconds=0)
+
+        assert get_latest_version() == CACHED_VERSION
+
+        assert fake_fetch.calls == 0
+        assert refresh_threads == []
+
+    def test_stale_cache_refreshes_in_background(
+        self,
+        cache_file: Path,
+        fake_fetch: FakeFetch,
+        refresh_threads: list[threading.Thread],
+    ) -> None:
+        """Test that a stale cache is returned at once and refreshed in the background."""
+        write_cache(cache_file, age_seconds=CACHE_TTL_SECONDS + 1)
+
+        assert get_latest_version() == CACHED_VERSION
+
+        assert len(refresh_threads) == 1
+        refresh_threads[0].join(timeout=5)
+        assert fake_fetch.calls == 1
+        assert read_cached_version(cache_file) == FETCHED_VERSION
+        assert get_latest_version() == FETCHED_VERSION
+
+    def test_single_refresh_in_flight(
+        self,
+        cache_file: Path,
+        fake_fetch: FakeFetch,
+        refresh_threads: list[threading.Thread],
+    ) -> None:
+        """Test that only one background refresh runs at a time."""
+        write_cache(cache_file, age_seconds=CACHE_TTL_SECONDS + 1)
+        fake_fetch.release.clear()
+
+        results = [get_latest_version() for _ in range(3)]
+
+        assert results == [CACHED_VERSION] * 3
+        assert len(refresh_threads) == 1
+        fake_fetch.release.set()
+        refresh_threads[0].join(timeout=5)
+        assert fake_fetch.calls == 1
+
+
+class TestParseVersion:
+    """Tests for _parse_version."""
+
+    @pytest.mark.parametrize(
+        ("version_str", "expected"),
+        [
+            pytest.param("0.2.1", (0, 2, 1), id="plain"),
+            pytest.param("1.23.8", (1, 23, 8), id="multi-digit"),
+            pytest.param("1.0.0a1", (1, 0, 0), id="pre-release-suffix"),
+            pytest.param("1..2", (1, 0, 2), id="empty-part"),
+            pytest.param("v1.2", (0, 2), id="leading-letter"),
+            pytest.param("1_0.2", (1, 2), id="underscore"),
+            pytest.param("1.-2.3", (1, 0, 3), id="minus-sign"),
+            pytest.param("1.+2", (1, 0), id="plus-sign"),
+            pytest.param(" 1.2", (0, 2), id="leading-space"),
+            pytest.param("1.2 ", (1, 2), id="trailing-space"),
+        ],
+    )
+    def test_parse_version(self, version_str: str, expected: tuple[int, ...]) -> None:
+        """Test that each part parses to its leading digits, or 0 when there are none."""
+        assert _parse_version(version_str) == expected